@@ -40,21 +40,26 @@ class AdvancedSIGApp:
     def load_large_scale_data(self):
         """Load scraped data from cafe_scraper.py"""
         try:
-            # Try to load from new scraper first, fallback to old data
-            data_files = [
-                'data/merged_cafes_20250901_080649.json'
-            ]
-
-            data = None
-            for file_path in data_files:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    break
-
-            if not data:
+            # Pick the newest merger output in one scandir pass: DirEntry
+            # caches the stat, so this is one syscall per file and no
+            # hardcoded timestamped filename to keep in sync
+            data_file = None
+            latest_mtime = -1.0
+            with os.scandir('data') as entries:
+                for entry in entries:
+                    if (entry.is_file() and entry.name.startswith('merged_cafes_')
+                            and entry.name.endswith('.json')):
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime = mtime
+                            data_file = entry.path
+
+            if not data_file:
                 raise FileNotFoundError("No cafe data found")
 
+            with open(data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
             self.metadata = data.get('metadata', {})
 
             # Add missing metadata fields for template compatibility
@@ -1,3 +1,4 @@
+import itertools
 import json
 import time
 import random
@@ -5,15 +6,16 @@ import logging
 import argparse
 import os
 import csv
-import hashlib
 import re
 import signal
 import sys
+from collections import Counter
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Set, Tuple, Optional
+from typing import Any, List, Dict, Set, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import queue
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -28,8 +30,105 @@ from webdriver_manager.chrome import ChromeDriverManager
 import socket
 import urllib.parse
 import requests
-
-@dataclass
+import numpy as np
+
+try:
+    import orjson  # C encoder, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+def _dump_json(path: str, payload: Dict):
+    """Write payload as indented JSON, via orjson's C encoder when available
+
+    orjson emits UTF-8 directly, matching ensure_ascii=False output. Files
+    stay plain JSON so the merger and the Flask app read them unchanged.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+
+
+# Search-strategy vocabulary: compile-time constants hoisted to module
+# scope so _generate_search_strategies (called at init and again when
+# high-yield mode regenerates strategies) doesn't rebuild the lists
+# per call
+# Full keyword set for comprehensive scraping
+_BASE_KEYWORDS = (
+    "cafe", "coffee shop", "kedai kopi", "kopi", "coffee",
+    "roastery", "specialty coffee", "espresso bar", "coffee house",
+    "warung kopi", "tempat ngopi", "kopi tradisional", "kopi kekinian",
+)
+_CONTEXTS = (
+    "terbaik", "buat nugas", "buka 24 jam", "cozy", "di", "hits", "instagrammable", "kalcer", "late night",
+    "live music", "murah", "paling rame", "populer", "recommended", "skena", "sunset spot",
+    "terdekat", "view bagus", "viral"
+)
+# Kabupaten/Kota-level (DIY regions)
+_REGIONS = (
+    "yogyakarta", "sleman", "bantul", "kulon progo", "gunungkidul", "kota jogja", "DIY"
+)
+# Kecamatan/sub-area populer
+_SUB_AREAS = (
+    # Sleman & sekitar UGM
+    "malioboro", "condongcatur", "depok", "caturtunggal", "seturan",
+    "gejayan", "pogung", "kentungan", "babarsari", "kalasan", "ngaglik",
+    "mlati", "gamping", "godean", "berbah", "prambanan", "cangkringan",
+    "pakem", "turi", "tempel", "seyegan", "minggir", "moyudan", "jakal",
+    "demangan", "klebengan",
+
+    # Bantul
+    "sewon", "kasihan", "banguntapan", "pleret", "pajangan", "imogiri",
+    "pundong", "kretek", "sanden", "bambanglipuro", "srandakan", "dlingo",
+    # Kulon Progo
+    "wates", "panjatan", "galur", "lendah", "sentolo", "pengasih",
+    "kokap", "nanggulan", "girimulyo", "kalibawang", "temon",
+    # Gunungkidul
+    "wonosari", "playen", "paliyan", "panggang", "purwosari", "tepus",
+    "rongkop", "girisubo", "semanu", "tanjungsari", "ponjong", "patuk",
+    "karangmojo", "gedangsari", "ngawen"
+)
+# Landmark/places of interest
+_LANDMARKS = (
+    "alun alun kidul", "alun alun utara", "ambarukmo plaza", "bukit bintang",
+    "gembira loka zoo", "goa pindul", "hartono mall", "heha sky view",
+    "jogja city mall", "kaliurang", "keraton yogyakarta", "mangunan",
+    "merapi museum", "monjali", "parangtritis beach", "pinus pengger",
+    "prambanan temple", "ratu boko", "sindu kusuma edupark", "taman sari",
+    "tebing breksi", "tugu jogja", "waduk sermo", "xt square",
+    "yogyakarta international airport",
+)
+# University in Yogyakarta
+_UNIVERSITIES_JOGJA = (
+    "ugm", "uii", "upn", "uin", "uny", "usd", "amikom", "udb", "stikes", "instiper", "akprind", "isi", "ukdw", "uty", "umy", "uad"
+)
+_ESSENTIAL_MENU = ("magic","latte","dirty latte","matcha","butterscotch","americano","cappuccino","flat white","mocha","caramel macchiato")
+_KATA_TEMPAT = ("dekat", "di", "sekitar", "area")
+_AWALAN = ("jual", "rekomendasi", "beli", "cafe")
+
+# Precompiled extraction patterns: these run per line / per link inside the
+# hot extraction loops, so skip re's cache lookup (and IGNORECASE re-parse)
+# on every call
+_URL_COORDS_RE = re.compile(r'@(-?\d+\.?\d*),(-?\d+\.?\d*),\d+z')
+_URL_3D4D_RE = re.compile(r'!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)')
+_COORD_PAIR_RE = re.compile(r'(-?\d+\.?\d*),\s*(-?\d+\.?\d*)')
+_RATING_REVIEWS_PRICE_RE = re.compile(r'(\d+[.,]\d+)\s*\(([0-9,.k]+)\)\s*·\s*(.*)')
+_RATING_REVIEWS_RE = re.compile(r'(\d+[.,]\d+)\s*\(([0-9,.k]+)\)')
+_RATING_RE = re.compile(r'(\d+[.,]\d*)')
+_PHONE_CHARS_RE = re.compile(r'[\d\+\-\s\(\)]{8,}')
+_PRICE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Rp\s*[\d.,]+\s*[--]\s*[\d.,]+\s*(?:rb|ribu|k)?',
+    r'\$\s*[\d.,]+\s*[--]\s*[\d.,]+',
+    r'€\s*[\d.,]+\s*[--]\s*[\d.,]+',
+    r'[\d.,]+\s*[--]\s*[\d.,]+\s*(?:USD|IDR|rb|ribu)',
+))
+_NAME_SPECIALS_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@dataclass(slots=True)
 class CafeData:
     """Complete cafe data structure with precise coordinates"""
     name: str
@@ -53,10 +152,13 @@ class CafeData:
     coordinate_source: str = ""
     precision_score: float = 0.0
 
-    def get_hash(self) -> str:
-        """Generate unique hash for deduplication"""
-        unique_string = f"{self.name.lower().strip()}_{self.lat:.6f}_{self.lon:.6f}"
-        return hashlib.md5(unique_string.encode()).hexdigest()
+    def get_dedup_key(self) -> Tuple[str, float, float]:
+        """Generate unique key for deduplication
+
+        A plain tuple: the set hashes it natively in C, with no string
+        building, UTF-8 encode or MD5 digest per cafe.
+        """
+        return (self.name.lower().strip(), round(self.lat, 6), round(self.lon, 6))
 
 
 class AntiDetectionManager:
@@ -192,6 +294,8 @@ class AntiDetectionManager:
         # Memory and performance
         options.add_argument("--memory-pressure-off")
         options.add_argument("--max_old_space_size=4096")
+        # Skip image decode/paint entirely; extraction only reads text/DOM
+        options.add_argument("--blink-settings=imagesEnabled=false")
 
         # Randomize viewport
         options.add_argument(f"--window-position={random.randint(0, 100)},{random.randint(0, 100)}")
@@ -222,6 +326,56 @@ class AntiDetectionManager:
         self.session_count += 1
 
 
+class BrowserPool:
+    """🏊 Bounded pool of pre-warmed Chrome drivers for session rotation"""
+
+    def __init__(self, scraper, size: int = 2):
+        self.scraper = scraper
+        self.size = size
+        self._pool = queue.Queue(maxsize=size)
+
+    def checkout(self, headless: bool = True):
+        """Get a pre-warmed driver if one is available, else create a fresh one"""
+        while True:
+            try:
+                driver = self._pool.get_nowait()
+            except queue.Empty:
+                return self.scraper.create_driver(headless)
+
+            # Make sure the pooled driver is still alive before reusing it
+            try:
+                _ = driver.window_handles
+                return driver
+            except WebDriverException:
+                continue
+
+    def release(self, driver):
+        """Return a driver to the pool instead of quitting it"""
+        if driver is None:
+            return
+
+        try:
+            driver.delete_all_cookies()
+            self._pool.put_nowait(driver)
+        except (queue.Full, WebDriverException):
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def close_all(self):
+        """Quit every pooled driver (call at shutdown)"""
+        while True:
+            try:
+                driver = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
 class BatchProcessor:
     """🔄 Batch processing with long intervals for stealth scraping"""
 
@@ -293,10 +447,9 @@ class BatchProcessor:
                 actual_interval = self.batch_interval + random.uniform(-variation, variation)
                 time.sleep(actual_interval)
 
-                # Restart driver for fresh session
-                self.scraper.logger.info("🔄 Restarting driver for fresh session...")
-                if self.scraper.driver:
-                    self.scraper.driver.quit()
+                # Rotate driver for fresh session (pooled driver if available)
+                self.scraper.logger.info("🔄 Rotating driver for fresh session...")
+                self.scraper.release_driver()
                 self.scraper.setup_driver(headless=True)
 
 
@@ -324,9 +477,8 @@ class MultiSessionManager:
         """Rotate to a new session with fresh driver"""
         self.scraper.logger.info(f"🔄 Rotating to new session (#{self.session_count + 1})")
 
-        # Close current session
-        if self.scraper.driver:
-            self.scraper.driver.quit()
+        # Return current session's driver to the pool
+        self.scraper.release_driver()
 
         # Wait between sessions
         if self.session_count > 1 :
@@ -410,19 +562,43 @@ class UltimateCafeScraper:
 
         # Data storage with thread safety
         self.all_cafes: List[CafeData] = []
-        self.seen_hashes: Set[str] = set()
+        self.seen_hashes: Set[Tuple[str, float, float]] = set()
         self.seen_names: Set[str] = set()  # Additional dedup by name
         self.seen_coordinates: Set[Tuple[float, float]] = set()  # Dedup by coords
+        # Maps every dedup key form (tuple key, normalized name, rounded
+        # coords) to the cafe's index in all_cafes, so a duplicate hit can
+        # locate - and possibly upgrade - the stored record
+        self._index_of: Dict[Any, int] = {}
+        # Cheap pre-extraction fingerprints of list-card text (per-run only:
+        # built-in hash() is salted per process, so never persist these)
+        self._pre_seen: Set[int] = set()
         self.data_lock = threading.Lock()  # Thread safety for data operations
 
+        # Running precision counters, updated as cafes are added so that
+        # save_data/print_final_summary don't re-scan all_cafes every save
+        self._precision_sum = 0.0
+        self._high_precision_unique = 0
+        self._source_counts: Counter = Counter()
+
         # Selenium components
         self.driver = None
         self.wait = None
+        self.browser_pool = BrowserPool(self, size=2)
 
         # Parallel processing settings
         self.max_workers = 3  # Number of parallel threads
         self.batch_size = 10  # Elements per batch
 
+        # Precomputed jitter ring buffer: per-element hot paths draw from this
+        # instead of paying a Mersenne-Twister update per random.uniform() call
+        # (same uniform distribution, generated vectorized up front)
+        self._jitter_ring = itertools.cycle(np.random.uniform(0.0, 1.0, size=4096).tolist())
+
+        # Token-bucket style throttle between element batches:
+        # a cooldown is only charged when a batch actually produced results,
+        # and naturally slow batches pay it off without extra sleeping
+        self._next_allowed_ts = 0.0
+
         # Productivity tracking with comprehensive settings
         self.consecutive_empty_queries = 0
         self.max_consecutive_empty = 500  # Increase for comprehensive coverage
@@ -502,8 +678,7 @@ class UltimateCafeScraper:
                 'timestamp': datetime.now().isoformat()
             }
 
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, indent=2, ensure_ascii=False)
+            _dump_json(self.state_file, state_data)
 
             # Save current cafe data
             resume_data = {
@@ -515,8 +690,7 @@ class UltimateCafeScraper:
                 }
             }
 
-            with open(self.resume_data_file, 'w', encoding='utf-8') as f:
-                json.dump(resume_data, f, indent=2, ensure_ascii=False)
+            _dump_json(self.resume_data_file, resume_data)
 
             self.logger.info(f"💾 State saved to {self.state_file}")
             self.logger.info(f"💾 Resume data saved to {self.resume_data_file}")
@@ -541,7 +715,9 @@ class UltimateCafeScraper:
             self.stats = state_data.get('stats', self.stats)
 
             # Restore deduplication sets
-            self.seen_hashes = set(state_data.get('seen_hashes', []))
+            # Tuple keys round-trip through JSON as lists
+            self.seen_hashes = set(tuple(key) if isinstance(key, list) else key
+                                 for key in state_data.get('seen_hashes', []))
             self.seen_names = set(state_data.get('seen_names', []))
             self.seen_coordinates = set(tuple(coord) if isinstance(coord, list) else coord
                                      for coord in state_data.get('seen_coordinates', []))
@@ -550,12 +726,21 @@ class UltimateCafeScraper:
             with open(self.resume_data_file, 'r', encoding='utf-8') as f:
                 resume_data = json.load(f)
 
-            # Restore cafes
+            # Restore cafes and rebuild running precision counters
             self.all_cafes = []
+            self._precision_sum = 0.0
+            self._high_precision_unique = 0
+            self._source_counts = Counter()
+            self._index_of = {}
             for cafe_dict in resume_data.get('cafes', []):
                 # Convert dict back to CafeData object
                 cafe = CafeData(**cafe_dict)
+                self._register_cafe_keys(cafe, len(self.all_cafes))
                 self.all_cafes.append(cafe)
+                self._precision_sum += cafe.precision_score
+                if cafe.precision_score >= 0.8:
+                    self._high_precision_unique += 1
+                self._source_counts[cafe.coordinate_source] += 1
 
             saved_time = state_data.get('timestamp', 'unknown')
             self.logger.info(f"✅ State loaded from {saved_time}")
@@ -607,25 +792,51 @@ class UltimateCafeScraper:
                 self.should_stop = True
                 break
 
+    def _jitter(self, low: float, high: float) -> float:
+        """Draw a uniform jitter value from the precomputed ring buffer"""
+        return low + (high - low) * next(self._jitter_ring)
+
     def is_duplicate(self, cafe: CafeData) -> bool:
         """Enhanced duplicate detection with multiple criteria"""
+        return self._find_duplicate_index(cafe) is not None
+
+    def _find_duplicate_index(self, cafe: CafeData) -> Optional[int]:
+        """Locate an already-stored duplicate of this cafe, if any
+
+        Checks the same three criteria as before: exact dedup key,
+        normalized name, then coordinate proximity (within ~10 meters).
+        """
         # Check hash (primary method)
-        cafe_hash = cafe.get_hash()
-        if cafe_hash in self.seen_hashes:
-            return True
+        idx = self._index_of.get(cafe.get_dedup_key())
+        if idx is not None:
+            return idx
 
         # Check name similarity (normalize and compare)
-        normalized_name = self._normalize_name(cafe.name)
-        if normalized_name in self.seen_names:
-            return True
+        idx = self._index_of.get(self._normalize_name(cafe.name))
+        if idx is not None:
+            return idx
 
         # Check coordinate proximity (within ~10 meters)
         if cafe.lat and cafe.lon:
-            coord_tuple = (round(cafe.lat, 4), round(cafe.lon, 4))  # ~11m precision
-            if coord_tuple in self.seen_coordinates:
-                return True
+            return self._index_of.get((round(cafe.lat, 4), round(cafe.lon, 4)))  # ~11m precision
 
-        return False
+        return None
+
+    def _register_cafe_keys(self, cafe: CafeData, index: int):
+        """Point all of a cafe's dedup key forms at its all_cafes slot"""
+        self.seen_hashes.add(cafe.get_dedup_key())
+        self.seen_names.add(self._normalize_name(cafe.name))
+        self._index_of[cafe.get_dedup_key()] = index
+        self._index_of[self._normalize_name(cafe.name)] = index
+        if cafe.lat and cafe.lon:
+            coord_tuple = (round(cafe.lat, 4), round(cafe.lon, 4))
+            self.seen_coordinates.add(coord_tuple)
+            self._index_of[coord_tuple] = index
+
+    @staticmethod
+    def _richness(cafe: CafeData) -> int:
+        """Count of populated fields - used to pick the better duplicate"""
+        return sum(1 for name in CafeData.__dataclass_fields__ if getattr(cafe, name))
 
     def _normalize_name(self, name: str) -> str:
         """Normalize cafe name for better duplicate detection"""
@@ -648,127 +859,88 @@ class UltimateCafeScraper:
                 normalized = normalized[:-len(suffix)].strip()
 
         # Remove special characters and extra spaces
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = _NAME_SPECIALS_RE.sub('', normalized)
+        normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
 
         return normalized
 
     def add_cafe_if_unique(self, cafe: CafeData) -> bool:
-        """Thread-safe method to add cafe if it's unique"""
+        """Thread-safe method to add cafe if it's unique
+
+        On a duplicate hit the richer of the two records wins: a later
+        sighting that carries more populated fields replaces the stored one
+        in place instead of being discarded.
+        """
         with self.data_lock:
-            if self.is_duplicate(cafe):
+            existing_index = self._find_duplicate_index(cafe)
+            if existing_index is not None:
                 self.stats['duplicates_removed'] += 1
-                self.logger.debug(f"🔄 Duplicate detected: {cafe.name}")
+                existing = self.all_cafes[existing_index]
+                if self._richness(cafe) > self._richness(existing):
+                    # Swap in the richer record and move its contribution in
+                    # the running counters from the old record to the new one
+                    self.all_cafes[existing_index] = cafe
+                    self._precision_sum += cafe.precision_score - existing.precision_score
+                    if existing.precision_score >= 0.8:
+                        self._high_precision_unique -= 1
+                    if cafe.precision_score >= 0.8:
+                        self._high_precision_unique += 1
+                    self._source_counts[existing.coordinate_source] -= 1
+                    if not self._source_counts[existing.coordinate_source]:
+                        # Counter keeps zero-count keys; drop them so summaries
+                        # and save_data only ever see sources that occur
+                        del self._source_counts[existing.coordinate_source]
+                    self._source_counts[cafe.coordinate_source] += 1
+                    self._register_cafe_keys(cafe, existing_index)
+                    self.logger.debug(f"🔄 Duplicate upgraded to richer record: {cafe.name}")
+                else:
+                    self.logger.debug(f"🔄 Duplicate detected: {cafe.name}")
                 return False
 
-            # Add to tracking sets
-            self.seen_hashes.add(cafe.get_hash())
-            self.seen_names.add(self._normalize_name(cafe.name))
-            if cafe.lat and cafe.lon:
-                coord_tuple = (round(cafe.lat, 4), round(cafe.lon, 4))
-                self.seen_coordinates.add(coord_tuple)
-
-            # Add to results
+            # Add to tracking sets and results
+            self._register_cafe_keys(cafe, len(self.all_cafes))
             self.all_cafes.append(cafe)
             self.stats['unique_cafes'] += 1
+            self._precision_sum += cafe.precision_score
+            if cafe.precision_score >= 0.8:
+                self._high_precision_unique += 1
+            self._source_counts[cafe.coordinate_source] += 1
             self.logger.debug(f"✅ Added unique cafe: {cafe.name}")
             return True
 
     def _generate_search_strategies(self) -> List[Dict]:
         """Generate search strategies with optional high-yield filtering and specialty coverage"""
-
-        # Full keyword set for comprehensive scraping
-        base_keywords = [
-            "cafe", "coffee shop", "kedai kopi", "kopi", "coffee",
-            "roastery", "specialty coffee", "espresso bar", "coffee house",
-            "warung kopi", "tempat ngopi", "kopi tradisional", "kopi kekinian",
-        ]
-
-        contexts = [
-            "terbaik", "buat nugas", "buka 24 jam", "cozy", "di", "hits", "instagrammable", "kalcer", "late night",
-            "live music", "murah", "paling rame", "populer", "recommended", "skena", "sunset spot",
-            "terdekat", "view bagus", "viral"
-        ]
-
-        # Kabupaten/Kota-level (DIY regions)
-        regions = [
-            "yogyakarta", "sleman", "bantul", "kulon progo", "gunungkidul", "kota jogja", "DIY"
-        ]
-
-        # Kecamatan/sub-area populer
-        sub_areas = [
-            # Sleman & sekitar UGM
-            "malioboro", "condongcatur", "depok", "caturtunggal", "seturan",
-            "gejayan", "pogung", "kentungan", "babarsari", "kalasan", "ngaglik",
-            "mlati", "gamping", "godean", "berbah", "prambanan", "cangkringan",
-            "pakem", "turi", "tempel", "seyegan", "minggir", "moyudan", "jakal",
-            "demangan", "klebengan",
-
-            # Bantul
-            "sewon", "kasihan", "banguntapan", "pleret", "pajangan", "imogiri",
-            "pundong", "kretek", "sanden", "bambanglipuro", "srandakan", "dlingo",
-            # Kulon Progo
-            "wates", "panjatan", "galur", "lendah", "sentolo", "pengasih",
-            "kokap", "nanggulan", "girimulyo", "kalibawang", "temon",
-            # Gunungkidul
-            "wonosari", "playen", "paliyan", "panggang", "purwosari", "tepus",
-            "rongkop", "girisubo", "semanu", "tanjungsari", "ponjong", "patuk",
-            "karangmojo", "gedangsari", "ngawen"
-        ]
-
-        # Landmark/places of interest
-        landmarks = [
-            "alun alun kidul", "alun alun utara", "ambarukmo plaza", "bukit bintang",
-            "gembira loka zoo", "goa pindul", "hartono mall", "heha sky view",
-            "jogja city mall", "kaliurang", "keraton yogyakarta", "mangunan",
-            "merapi museum", "monjali", "parangtritis beach", "pinus pengger",
-            "prambanan temple", "ratu boko", "sindu kusuma edupark", "taman sari",
-            "tebing breksi", "tugu jogja", "waduk sermo", "xt square",
-            "yogyakarta international airport",
-        ]
-
-        # University in Yogyakarta
-        universities_jogja = [
-            "ugm", "uii", "upn", "uin", "uny", "usd", "amikom", "udb", "stikes", "instiper", "akprind", "isi", "ukdw", "uty", "umy", "uad"
-        ]
-
-        essential_menu = ["magic","latte","dirty latte","matcha","butterscotch","americano","cappuccino","flat white","mocha","caramel macchiato"]
-
-        kata_tempat = ["dekat", "di", "sekitar", "area"]
-
         all_queries = set()
 
         # Kombinasi base keywords dengan konteks & wilayah besar
-        for kw in base_keywords:
-            for ctx in contexts:
-                for reg in regions:
+        for kw in _BASE_KEYWORDS:
+            for ctx in _CONTEXTS:
+                for reg in _REGIONS:
                     query = f"{kw} {ctx} {reg}".strip()
                     all_queries.add(query)
 
         # Tambahin kombinasi dengan sub-area
-        for area in sub_areas:
-            query = f"{base_keywords[random.randint(0, len(base_keywords) - 1)]} {kata_tempat[random.randint(0, len(kata_tempat) - 1)]} {area}".strip()
+        for area in _SUB_AREAS:
+            query = f"{_BASE_KEYWORDS[random.randint(0, len(_BASE_KEYWORDS) - 1)]} {_KATA_TEMPAT[random.randint(0, len(_KATA_TEMPAT) - 1)]} {area}".strip()
             all_queries.add(query)
 
         # Tambahin kombinasi dengan landmark
-        for kw in base_keywords:
-            for lm in landmarks:
-                query = f"{kw} {kata_tempat[random.randint(0, len(kata_tempat) - 1)]} {lm}".strip()
+        for kw in _BASE_KEYWORDS:
+            for lm in _LANDMARKS:
+                query = f"{kw} {_KATA_TEMPAT[random.randint(0, len(_KATA_TEMPAT) - 1)]} {lm}".strip()
                 all_queries.add(query)
 
         # Tambahin kombinasi dengan university
-        for kw in base_keywords:
-            for ctx in contexts:
-                for uni in universities_jogja:
-                    query = f"{kw} {ctx} {kata_tempat[random.randint(0, len(kata_tempat) - 1)]} {uni} jogja".strip()
+        for kw in _BASE_KEYWORDS:
+            for ctx in _CONTEXTS:
+                for uni in _UNIVERSITIES_JOGJA:
+                    query = f"{kw} {ctx} {_KATA_TEMPAT[random.randint(0, len(_KATA_TEMPAT) - 1)]} {uni} jogja".strip()
                     all_queries.add(query)
 
-        awalan = ["jual", "rekomendasi", "beli", "cafe"]
-
         # Tambahin kombinasi dengan menu
-        for menu in essential_menu:
-            for reg in regions:
-                query = f"{awalan[random.randint(0, len(awalan) - 1)]} {menu} {kata_tempat[random.randint(0, len(kata_tempat) - 1)]} {reg}".strip()
+        for menu in _ESSENTIAL_MENU:
+            for reg in _REGIONS:
+                query = f"{_AWALAN[random.randint(0, len(_AWALAN) - 1)]} {menu} {_KATA_TEMPAT[random.randint(0, len(_KATA_TEMPAT) - 1)]} {reg}".strip()
                 all_queries.add(query)
 
         strategies = []
@@ -776,26 +948,26 @@ class UltimateCafeScraper:
         for q in sorted(all_queries):
             words = q.split()
 
-            if any (sub_area in q.lower() for sub_area in sub_areas):
+            if any (sub_area in q.lower() for sub_area in _SUB_AREAS):
                 strategies.append({
                     'query': q,
                     'expected_results': 100,
                     'priority': 0
                 })
 
-            if any(region in q.lower() for region in regions):
+            if any(region in q.lower() for region in _REGIONS):
                 strategies.append({
                     'query': q,
                     'expected_results': 100,
                     'priority': 0
                 })
-            elif any(uni in q.lower() for uni in universities_jogja):
+            elif any(uni in q.lower() for uni in _UNIVERSITIES_JOGJA):
                 strategies.append({
                     'query': q,
                     'expected_results': 100,
                     'priority': 1
                 })
-            elif any(menu in q.lower() for menu in essential_menu):
+            elif any(menu in q.lower() for menu in _ESSENTIAL_MENU):
                 strategies.append({
                     'query': q,
                     'expected_results': 100,
@@ -825,20 +997,38 @@ class UltimateCafeScraper:
         return strategies
 
     def setup_driver(self, headless: bool = True):
-        """Setup Chrome driver with advanced anti-detection"""
+        """Setup Chrome driver, reusing a pre-warmed one from the pool if possible"""
+        self.driver = self.browser_pool.checkout(headless)
+
+        # Set random wait timeout
+        wait_timeout = random.randint(5, 18)
+        self.wait = WebDriverWait(self.driver, wait_timeout)
+
+    def release_driver(self):
+        """Return the current driver to the pool (call at session end)"""
+        self.browser_pool.release(self.driver)
+        self.driver = None
+        self.wait = None
+
+    # Resolved chromedriver binary path, shared across all drivers created
+    # in this process: ChromeDriverManager().install() re-checks disk (and
+    # possibly the network) on every call otherwise
+    _driver_path: Optional[str] = None
+
+    def create_driver(self, headless: bool = True):
+        """Create a new Chrome driver with advanced anti-detection"""
         # Use enhanced options from anti-detection manager
         options = self.anti_detection.get_enhanced_chrome_options(headless)
 
         try:
-            self.driver = webdriver.Chrome(
-                service=webdriver.chrome.service.Service(ChromeDriverManager().install()),
+            if UltimateCafeScraper._driver_path is None:
+                UltimateCafeScraper._driver_path = ChromeDriverManager().install()
+
+            driver = webdriver.Chrome(
+                service=webdriver.chrome.service.Service(UltimateCafeScraper._driver_path),
                 options=options
             )
 
-            # Set random wait timeout
-            wait_timeout = random.randint(5, 18)
-            self.wait = WebDriverWait(self.driver, wait_timeout)
-
             # Execute stealth scripts to hide automation
             stealth_script = """
                 Object.defineProperty(navigator, 'webdriver', {
@@ -859,9 +1049,27 @@ class UltimateCafeScraper:
                     }),
                 });
             """
-            self.driver.execute_script(stealth_script)
+            driver.execute_script(stealth_script)
+
+            # Block heavyweight resources the extraction never reads: tiles,
+            # avatars, fonts and telemetry dominate bytes-on-the-wire and
+            # paint time on Maps pages. Best-effort - CDP may be unavailable
+            # on remote drivers
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                    'urls': [
+                        '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif',
+                        '*.woff', '*.woff2',
+                        '*google-analytics*', '*doubleclick*', '*googletagmanager*'
+                    ]
+                })
+                driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+            except Exception as e:
+                self.logger.debug(f"CDP request blocking unavailable: {e}")
 
             self.logger.info(f"✅ Chrome driver initialized with anti-detection (UA: {self.anti_detection.get_random_user_agent()[:50]}...)")
+            return driver
 
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize driver: {e}")
@@ -904,16 +1112,14 @@ class UltimateCafeScraper:
                     continue
 
                 # Pattern 1: @lat,lon,zoom format
-                pattern1 = r'@(-?\d+\.?\d*),(-?\d+\.?\d*),\d+z'
-                match = re.search(pattern1, href)
+                match = _URL_COORDS_RE.search(href)
                 if match:
                     lat, lon = float(match.group(1)), float(match.group(2))
                     self.logger.debug(f"🎯 URL coordinates: {lat:.6f}, {lon:.6f}")
                     return lat, lon, 0.95
 
                 # Pattern 2: !3d and !4d format
-                pattern2 = r'!3d(-?\d+\.?\d*)!4d(-?\d+\.?\d*)'
-                match = re.search(pattern2, href)
+                match = _URL_3D4D_RE.search(href)
                 if match:
                     lat, lon = float(match.group(1)), float(match.group(2))
                     self.logger.debug(f"🎯 URL coordinates (3d/4d): {lat:.6f}, {lon:.6f}")
@@ -954,8 +1160,7 @@ class UltimateCafeScraper:
         try:
             onclick = element.get_attribute('onclick')
             if onclick:
-                pattern = r'(-?\d+\.?\d*),\s*(-?\d+\.?\d*)'
-                matches = re.findall(pattern, onclick)
+                matches = _COORD_PAIR_RE.findall(onclick)
 
                 for match in matches:
                     lat, lon = float(match[0]), float(match[1])
@@ -973,8 +1178,7 @@ class UltimateCafeScraper:
         try:
             aria_label = element.get_attribute('aria-label')
             if aria_label:
-                pattern = r'(-?\d+\.?\d*),\s*(-?\d+\.?\d*)'
-                matches = re.findall(pattern, aria_label)
+                matches = _COORD_PAIR_RE.findall(aria_label)
 
                 for match in matches:
                     lat, lon = float(match[0]), float(match[1])
@@ -1088,10 +1292,15 @@ class UltimateCafeScraper:
         else:
             return 'Modern'
 
-    def extract_cafe_data(self, element, query: str, extract_details: bool = True) -> Optional[CafeData]:
-        """Extract complete cafe data with precise coordinates"""
+    def extract_cafe_data(self, element, query: str, extract_details: bool = True,
+                          raw_text: Optional[str] = None) -> Optional[CafeData]:
+        """Extract complete cafe data with precise coordinates
+
+        raw_text lets callers that already read element.text pass it in,
+        avoiding a second round-trip that re-serializes the card subtree.
+        """
         try:
-            full_text = element.text.strip()
+            full_text = (element.text if raw_text is None else raw_text).strip()
             if not full_text:
                 return None
 
@@ -1127,7 +1336,7 @@ class UltimateCafeScraper:
             # Parse additional info
             for line in lines[1:]:
                 # Combined rating, reviews, and price extraction from lines like "4,5(7.602) · Rp 25-50 rb"
-                rating_reviews_price_match = re.search(r'(\d+[.,]\d+)\s*\(([0-9,.k]+)\)\s*·\s*(.*)', line)
+                rating_reviews_price_match = _RATING_REVIEWS_PRICE_RE.search(line)
                 if rating_reviews_price_match:
                     # Extract rating
                     cafe.rating = float(rating_reviews_price_match.group(1).replace(',', '.'))
@@ -1149,7 +1358,7 @@ class UltimateCafeScraper:
 
                 # Fallback: Rating and reviews only - look for pattern like "4,5(7.602)"
                 elif not cafe.rating:
-                    rating_reviews_match = re.search(r'(\d+[.,]\d+)\s*\(([0-9,.k]+)\)', line)
+                    rating_reviews_match = _RATING_REVIEWS_RE.search(line)
                     if rating_reviews_match:
                         # Extract rating
                         cafe.rating = float(rating_reviews_match.group(1).replace(',', '.'))
@@ -1174,22 +1383,15 @@ class UltimateCafeScraper:
                 # Standalone price patterns (without separator)
                 elif not cafe.price_range and any(currency in line for currency in ['Rp', '$', '€', 'USD', 'IDR']):
                     # Look for price patterns like "Rp 25-50 rb", "$10-20", etc.
-                    price_patterns = [
-                        r'Rp\s*[\d.,]+\s*[--]\s*[\d.,]+\s*(?:rb|ribu|k)?',
-                        r'\$\s*[\d.,]+\s*[--]\s*[\d.,]+',
-                        r'€\s*[\d.,]+\s*[--]\s*[\d.,]+',
-                        r'[\d.,]+\s*[--]\s*[\d.,]+\s*(?:USD|IDR|rb|ribu)',
-                    ]
-
-                    for pattern in price_patterns:
-                        price_match = re.search(pattern, line, re.IGNORECASE)
+                    for price_re in _PRICE_RES:
+                        price_match = price_re.search(line)
                         if price_match:
                             cafe.price_range = price_match.group(0).strip()
                             break
 
                 # Also try standalone rating pattern
                 elif '⭐' in line or '★' in line:
-                    rating_match = re.search(r'(\d+[.,]\d*)', line)
+                    rating_match = _RATING_RE.search(line)
                     if rating_match and not cafe.rating:  # Only if not already found
                         cafe.rating = float(rating_match.group(1).replace(',', '.'))
 
@@ -1233,120 +1435,19 @@ class UltimateCafeScraper:
             # Save current window handle
             original_window = self.driver.current_window_handle
 
-            # Click on the element to get more details
+            # Click on the element to get more details and wait for the
+            # detail pane to render instead of a fixed 2s sleep
             self.driver.execute_script("arguments[0].click();", element)
-            time.sleep(2)
-
-            # Address (detail pane provides full address reliably)
-            if not cafe.address:
-                try:
-                    addr_el = self.driver.find_element(By.CSS_SELECTOR, 'button.CsEnBe[data-item-id="address"] .Io6YTe')
-                    txt = addr_el.text.strip()
-                    if txt:
-                        cafe.address = txt
-                except Exception:
-                    pass
-
-            # Try to extract phone number
-            if not cafe.phone:
-                try:
-                    # New selector pattern: button with data-item-id starting with phone:tel:
-                    phone_btn = self.driver.find_element(By.CSS_SELECTOR, 'button.CsEnBe[data-item-id^="phone:tel:"]')
-                    # Prefer aria-label (contains "Telepon: <number>")
-                    aria = (phone_btn.get_attribute('aria-label') or '').strip()
-                    if 'Telepon:' in aria:
-                        cafe.phone = aria.split('Telepon:')[-1].strip()
-                    if not cafe.phone:
-                        # Try visible text inside button
-                        txt = phone_btn.text.strip()
-                        if txt:
-                            cafe.phone = txt
-                except:
-                    # Try alternative phone selectors
-                    phone_selectors = ['a[href^="tel:"]', '.rogA2c']
-                    for selector in phone_selectors:
-                        try:
-                            phone_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            phone_text = phone_elem.get_attribute('href') or phone_elem.text
-                            if phone_text:
-                                if phone_text.startswith('tel:'):
-                                    cafe.phone = phone_text.replace('tel:', '').strip()
-                                elif re.search(r'[\d\+\-\s\(\)]{8,}', phone_text):
-                                    cafe.phone = phone_text.strip()
-                                break
-                        except:
-                            continue
-
-            # Try to extract website
-            if not cafe.website:
-                try:
-                    # Primary: authority link in detail pane
-                    website_link = self.driver.find_element(By.CSS_SELECTOR, 'a.CsEnBe[data-item-id*="authority"]')
-                    website_url = website_link.get_attribute('href')
-                    if website_url and ('http' in website_url):
-                        # Clean up the URL
-                        if 'instagram.com' in website_url:
-                            cafe.website = website_url
-                        elif 'facebook.com' in website_url:
-                            cafe.website = website_url
-                        elif website_url.startswith('http'):
-                            cafe.website = website_url
-                except:
-                    # Try alternative website selectors
-                    website_selectors = ['a[href^="http"]']
-                    for selector in website_selectors:
-                        try:
-                            web_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            web_url = web_elem.get_attribute('href')
-                            if web_url and web_url.startswith('http') and 'google.com/maps' not in web_url:
-                                cafe.website = web_url
-                                break
-                        except:
-                            continue
-
-            # Try to get more detailed opening hours (weekly table)
             try:
-                # Open dropdown if collapsed
-                try:
-                    toggle = self.driver.find_element(By.CSS_SELECTOR, 'div.OMl5r[role="button"]')
-                    if toggle.get_attribute('aria-expanded') == 'false':
-                        toggle.click()
-                        time.sleep(1)
-                except Exception:
-                    pass
-
-                rows = self.driver.find_elements(By.CSS_SELECTOR, 'table.eK4R0e tr.y0skZc')
-                if rows:
-                    weekly = {}
-                    for row in rows:
-                        try:
-                            day = row.find_element(By.CSS_SELECTOR, 'td.ylH6lf').text.strip()
-                            hours = row.find_element(By.CSS_SELECTOR, 'td.mxowUb').text.strip()
-                            if day and hours:
-                                weekly[day] = hours
-                        except Exception:
-                            continue
-                    if weekly:
-                        cafe.opening_hours_weekly = weekly
-                        # Also set a concise opening_hours if empty
-                        if not cafe.opening_hours:
-                            # Pick a representative day (e.g., Senin)
-                            rep = weekly.get('Senin') or next(iter(weekly.values()), '')
-                            cafe.opening_hours = rep
-            except Exception:
+                WebDriverWait(self.driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'button.CsEnBe[data-item-id="address"]'))
+                )
+            except TimeoutException:
                 pass
 
-            # Price summary in detail (per person). Prefer summary text.
-            try:
-                price_btn = self.driver.find_element(By.CSS_SELECTOR, 'div.MNVeJb[role="button"]')
-                summary = price_btn.text.strip()
-                if summary:
-                    # Normalize to a concise form before the newline, if any
-                    summary_line = summary.split('\n')[0].strip()
-                    cafe.price_range = summary_line
-            except Exception:
-                # If histogram present, optionally choose dominant bucket (skipped to reduce page time)
-                pass
+            # One JS round-trip collects every detail field at once instead
+            # of a sequence of find_element wire calls
+            self._apply_detail_pane(cafe, self._extract_detail_pane())
 
             # Go back to list view
             try:
@@ -1383,10 +1484,11 @@ class UltimateCafeScraper:
             if not self.driver:
                 self.setup_driver(headless=True)
 
-            # Go to Google Maps with human-like delay
+            # Go to Google Maps; wait for the search box itself instead of
+            # a fixed worst-case delay, then add a short human-like jitter
             self.driver.get('https://maps.google.com')
-            human_delay = self.anti_detection.get_human_delay(2.5)
-            time.sleep(human_delay)
+            self.wait.until(EC.presence_of_element_located((By.ID, 'searchboxinput')))
+            time.sleep(self._jitter(0.5, 1.5))
 
             # Simulate human behavior before searching
             self.anti_detection.simulate_human_behavior(self.driver)
@@ -1398,14 +1500,20 @@ class UltimateCafeScraper:
             # Type with human-like delays
             for char in query:
                 search_box.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+                time.sleep(self._jitter(0.05, 0.15))
 
-            time.sleep(random.uniform(0.5, 1.2))
+            time.sleep(self._jitter(0.5, 1.2))
             search_box.send_keys(Keys.RETURN)
 
-            # Wait with human-like delay
-            wait_time = self.anti_detection.get_human_delay(4.0)
-            time.sleep(wait_time)
+            # Return as soon as result cards exist; the jitter keeps the
+            # pacing human-like without paying the worst-case network delay
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, '.Nv2PK'))
+                )
+            except TimeoutException:
+                pass
+            time.sleep(self._jitter(0.8, 1.6))
 
             # Auto-scroll to load more results
             self.auto_scroll_results(max_results)
@@ -1433,6 +1541,12 @@ class UltimateCafeScraper:
         self.logger.info(f"🚀 Processing {len(elements)} elements in {len(batches)} parallel batches")
 
         for batch_idx, batch in enumerate(batches):
+            # Pay off any remaining cooldown from the previous batch; if this
+            # point was reached late (heavy enrichment), the sleep is zero
+            sleep_for = self._next_allowed_ts - time.time()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+
             batch_results = []
 
             # Process batch with ThreadPoolExecutor
@@ -1449,51 +1563,179 @@ class UltimateCafeScraper:
                     element, idx = future_to_element[future]
                     try:
                         cafe = future.result()
-                        if cafe:
+                        if cafe is None:
+                            self.stats['failed_extractions'] += 1
+                        elif cafe is not self._DUPLICATE_CARD:
                             # Use thread-safe deduplication
                             if self.add_cafe_if_unique(cafe):
                                 batch_results.append(cafe)
                                 self.stats['successful_extractions'] += 1
                                 self.logger.info(f"✅ {cafe.name} - {cafe.coordinate_source} ({cafe.precision_score:.2f})")
                             # Duplicate message already logged in add_cafe_if_unique
-                        else:
-                            self.stats['failed_extractions'] += 1
+                        # _DUPLICATE_CARD was already counted in duplicates_removed
                     except Exception as e:
                         self.logger.warning(f"⚠️ Failed to process element in batch {batch_idx}: {e}")
                         self.stats['failed_extractions'] += 1
 
-            results.extend(batch_results)
-
-            # Sequentially enrich details by opening place links in a new tab
-            if extract_details and batch_results:
+            # Enrich only after the executor has drained: WebDriver window
+            # focus is session-global, so the detail tab must never be open
+            # (nor mid close/switch-back) while extraction threads are still
+            # reading the results list
+            if extract_details:
                 for cafe in batch_results:
                     try:
                         self.enrich_cafe_details_from_link(cafe)
                         # Be polite
-                        time.sleep(random.uniform(0.5, 1.2))
+                        time.sleep(self._jitter(0.5, 1.2))
                     except Exception as e:
                         self.logger.debug(f"Detail enrichment failed for {cafe.name}: {e}")
 
-            # Rate limiting between batches
-            if batch_idx < len(batches) - 1:  # Don't sleep after last batch
-                time.sleep(random.uniform(2, 4))
+            results.extend(batch_results)
+
+            # Rate limiting between batches: charge a cooldown only when the
+            # batch yielded extractions (no anti-bot pressure on empty batches)
+            if batch_idx < len(batches) - 1:  # Don't throttle after last batch
+                if batch_results:
+                    self._next_allowed_ts = time.time() + self._jitter(2, 4)
                 self.logger.debug(f"📊 Batch {batch_idx + 1}/{len(batches)} completed, {len(batch_results)} new cafes")
 
         return results
 
-    def process_single_element(self, element, query: str, idx: int, extract_details: bool = True) -> Optional[CafeData]:
-        """Process a single element (thread-safe)"""
+    # Sentinel for cards skipped by the pre-extraction fingerprint: lets the
+    # caller tell "already seen" (counted as duplicate) apart from "extraction
+    # produced nothing" (counted as failed), so each element lands in exactly
+    # one counter
+    _DUPLICATE_CARD = object()
+
+    def process_single_element(self, element, query: str, idx: int, extract_details: bool = True) -> Any:
+        """Process a single element (thread-safe)
+
+        Returns the CafeData, None on failure, or _DUPLICATE_CARD when the
+        card was skipped as a repeat before extraction.
+        """
         try:
             self.stats['total_processed'] += 1
 
+            # Fetch the card text once - every .text access re-serializes
+            # the subtree over the wire - and fingerprint it before doing any
+            # real work: a repeated card means full extraction (and the
+            # follow-up detail enrichment) would be thrown away by
+            # add_cafe_if_unique anyway
+            raw_text = element.text
+            if raw_text.strip():
+                # Never fingerprint empty text: a still-rendering card would
+                # poison _pre_seen and make every later slow-loading card
+                # count as a duplicate instead of a failed extraction
+                pre_hash = hash(raw_text[:120])
+                with self.data_lock:
+                    if pre_hash in self._pre_seen:
+                        self.stats['duplicates_removed'] += 1
+                        self.logger.debug(f"🔄 Duplicate card skipped before extraction (element {idx})")
+                        return self._DUPLICATE_CARD
+                    self._pre_seen.add(pre_hash)
+
             # Add small random delay to avoid overwhelming
-            time.sleep(random.uniform(0.1, 0.3))
+            time.sleep(self._jitter(0.1, 0.3))
 
-            return self.extract_cafe_data(element, query, extract_details)
+            return self.extract_cafe_data(element, query, extract_details, raw_text=raw_text)
         except Exception as e:
             self.logger.debug(f"Element {idx} processing failed: {e}")
             return None
 
+    # Everything the detail pane can give us, fetched in one JS evaluation:
+    # each find_element/.text call is a full WebDriver wire round-trip, so
+    # ~10 sequential lookups per cafe collapse into a single one here. The
+    # optional-chaining guards make missing elements yield nulls, not throws.
+    _DETAIL_PANE_JS = """
+        const qs = s => document.querySelector(s);
+        const txt = el => el?.textContent?.trim() ?? null;
+        const toggle = qs('div.OMl5r[role="button"]');
+        let hoursToggled = false;
+        if (toggle && toggle.getAttribute('aria-expanded') === 'false') {
+            toggle.click();
+            hoursToggled = true;
+        }
+        const phoneBtn = qs('button.CsEnBe[data-item-id^="phone:tel:"]');
+        return {
+            address: txt(qs('button.CsEnBe[data-item-id="address"] .Io6YTe')),
+            website: qs('a.CsEnBe[data-item-id*="authority"]')?.getAttribute('href') ?? null,
+            phoneAria: phoneBtn?.getAttribute('aria-label') ?? null,
+            phoneText: txt(phoneBtn),
+            telHref: qs('a[href^="tel:"]')?.getAttribute('href') ?? null,
+            hoursToggled: hoursToggled,
+            hoursRows: Array.from(document.querySelectorAll('table.eK4R0e tr.y0skZc'))
+                .map(r => [txt(r.querySelector('td.ylH6lf')), txt(r.querySelector('td.mxowUb'))]),
+            priceSummary: txt(qs('div.MNVeJb[role="button"]'))
+        };
+    """
+
+    # Re-read just the hours table after a toggle click: the expansion
+    # renders asynchronously, so rows read in the same evaluation as the
+    # click reflect the pre-click DOM
+    _HOURS_ROWS_JS = """
+        const txt = el => el?.textContent?.trim() ?? null;
+        return Array.from(document.querySelectorAll('table.eK4R0e tr.y0skZc'))
+            .map(r => [txt(r.querySelector('td.ylH6lf')), txt(r.querySelector('td.mxowUb'))]);
+    """
+
+    def _extract_detail_pane(self) -> Dict:
+        """Run the batched detail-pane query; one round-trip for all fields,
+        or two when the hours section started collapsed"""
+        try:
+            data = self.driver.execute_script(self._DETAIL_PANE_JS) or {}
+        except Exception as e:
+            self.logger.debug(f"Detail pane batch extraction failed: {e}")
+            return {}
+
+        if data.get('hoursToggled') and not data.get('hoursRows'):
+            try:
+                WebDriverWait(self.driver, 3, poll_frequency=0.2).until(
+                    lambda d: d.find_elements(By.CSS_SELECTOR, 'table.eK4R0e tr.y0skZc')
+                )
+                data['hoursRows'] = self.driver.execute_script(self._HOURS_ROWS_JS) or []
+            except Exception as e:
+                self.logger.debug(f"Hours rows did not appear after expanding: {e}")
+
+        return data
+
+    def _apply_detail_pane(self, cafe: CafeData, data: Dict):
+        """Fill empty cafe fields from a batched detail-pane result"""
+        if not data:
+            return
+
+        if not cafe.address and data.get('address'):
+            cafe.address = data['address']
+
+        if not cafe.website:
+            url = data.get('website') or ''
+            if url.startswith('http') and 'google.com/maps' not in url:
+                cafe.website = url
+
+        if not cafe.phone:
+            # Prefer aria-label (contains "Telepon: <number>"), then visible
+            # text, then a bare tel: link
+            aria = (data.get('phoneAria') or '').strip()
+            if 'Telepon:' in aria:
+                cafe.phone = aria.split('Telepon:')[-1].strip()
+            elif data.get('phoneText'):
+                cafe.phone = data['phoneText']
+            else:
+                tel = data.get('telHref') or ''
+                if tel.startswith('tel:'):
+                    cafe.phone = tel.replace('tel:', '').strip()
+
+        weekly = {day: hours for day, hours in (data.get('hoursRows') or []) if day and hours}
+        if weekly:
+            cafe.opening_hours_weekly = weekly
+            if not cafe.opening_hours:
+                # Pick a representative day (e.g., Senin)
+                cafe.opening_hours = weekly.get('Senin') or next(iter(weekly.values()), '')
+
+        summary = data.get('priceSummary')
+        if summary:
+            # Normalize to a concise form before the newline, if any
+            cafe.price_range = summary.split('\n')[0].strip()
+
     def enrich_cafe_details_from_link(self, cafe: CafeData):
         """Open the cafe's Google Maps place link in a new tab, extract details, then close the tab.
         This is more reliable than clicking list elements and keeps the results view intact."""
@@ -1519,84 +1761,8 @@ class UltimateCafeScraper:
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'div[role="region"]'))
                 )
 
-            # Address
-            if not cafe.address:
-                try:
-                    addr_el = self.driver.find_element(By.CSS_SELECTOR, 'button.CsEnBe[data-item-id="address"] .Io6YTe')
-                    txt = addr_el.text.strip()
-                    if txt:
-                        cafe.address = txt
-                except Exception:
-                    pass
-
-            # Website
-            if not cafe.website:
-                try:
-                    website_link = self.driver.find_element(By.CSS_SELECTOR, 'a.CsEnBe[data-item-id*="authority"]')
-                    url = website_link.get_attribute('href') or ''
-                    if url.startswith('http') and 'google.com/maps' not in url:
-                        cafe.website = url
-                except Exception:
-                    pass
-
-            # Phone
-            if not cafe.phone:
-                try:
-                    phone_btn = self.driver.find_element(By.CSS_SELECTOR, 'button.CsEnBe[data-item-id^="phone:tel:"]')
-                    aria = (phone_btn.get_attribute('aria-label') or '').strip()
-                    if 'Telepon:' in aria:
-                        cafe.phone = aria.split('Telepon:')[-1].strip()
-                    if not cafe.phone:
-                        txt = phone_btn.text.strip()
-                        if txt:
-                            cafe.phone = txt
-                except Exception:
-                    # Fallback tel link
-                    try:
-                        tel_a = self.driver.find_element(By.CSS_SELECTOR, 'a[href^="tel:"]')
-                        tel = tel_a.get_attribute('href') or ''
-                        if tel.startswith('tel:'):
-                            cafe.phone = tel.replace('tel:', '').strip()
-                    except Exception:
-                        pass
-
-            # Weekly opening hours
-            try:
-                # Expand if needed
-                try:
-                    toggle = self.driver.find_element(By.CSS_SELECTOR, 'div.OMl5r[role="button"]')
-                    if toggle.get_attribute('aria-expanded') == 'false':
-                        toggle.click()
-                        time.sleep(0.5)
-                except Exception:
-                    pass
-
-                rows = self.driver.find_elements(By.CSS_SELECTOR, 'table.eK4R0e tr.y0skZc')
-                weekly = {}
-                for row in rows:
-                    try:
-                        day = row.find_element(By.CSS_SELECTOR, 'td.ylH6lf').text.strip()
-                        hours = row.find_element(By.CSS_SELECTOR, 'td.mxowUb').text.strip()
-                        if day and hours:
-                            weekly[day] = hours
-                    except Exception:
-                        continue
-                if weekly:
-                    cafe.opening_hours_weekly = weekly
-                    if not cafe.opening_hours:
-                        rep = weekly.get('Senin') or next(iter(weekly.values()), '')
-                        cafe.opening_hours = rep
-            except Exception:
-                pass
-
-            # Price summary
-            try:
-                price_btn = self.driver.find_element(By.CSS_SELECTOR, 'div.MNVeJb[role="button"]')
-                summary = price_btn.text.strip()
-                if summary:
-                    cafe.price_range = summary.split('\n')[0].strip()
-            except Exception:
-                pass
+            # One JS round-trip collects every detail field at once
+            self._apply_detail_pane(cafe, self._extract_detail_pane())
 
         finally:
             # Close tab and return
@@ -1615,7 +1781,15 @@ class UltimateCafeScraper:
             while no_change_count < 3:
                 # Scroll down
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+
+                # Wait until new result cards actually appear instead of a
+                # fixed 2s sleep; returns as soon as the count grows
+                try:
+                    WebDriverWait(self.driver, 2, poll_frequency=0.2).until(
+                        lambda d: len(d.find_elements(By.CSS_SELECTOR, '.Nv2PK')) > last_count
+                    )
+                except TimeoutException:
+                    pass
 
                 # Count current results
                 current_results = len(self.driver.find_elements(By.CSS_SELECTOR, '.Nv2PK'))
@@ -1649,8 +1823,8 @@ class UltimateCafeScraper:
             return results
 
         finally:
-            if self.driver:
-                self.driver.quit()
+            self.release_driver()
+            self.browser_pool.close_all()
 
     def full_scrape(self, max_cafes: int = 1000, area_filter: str = None, results_per_query: int = 100,
                    batch_mode: bool = False, batch_size: int = 5, batch_interval: int = 1800,
@@ -1793,8 +1967,8 @@ class UltimateCafeScraper:
             self.save_data("error")
             self.save_state()
         finally:
-            if self.driver:
-                self.driver.quit()
+            self.release_driver()
+            self.browser_pool.close_all()
 
     def print_final_summary(self):
         """Print comprehensive final summary with deduplication stats"""
@@ -1825,21 +1999,15 @@ class UltimateCafeScraper:
         self.logger.info(f"   • Batch Size: {self.batch_size}")
         self.logger.info(f"   • Processing Speed: {self.stats['total_processed']/duration:.1f} elements/min")
 
-        # Quality stats
+        # Quality stats (running counters, no re-scan of all_cafes)
         if self.all_cafes:
             high_precision = self.stats['high_precision_count']
             precision_rate = high_precision / len(self.all_cafes) * 100
             self.logger.info(f"\n📍 COORDINATE PRECISION:")
             self.logger.info(f"   • High Precision (≥0.8): {high_precision} ({precision_rate:.1f}%)")
 
-            # Top coordinate sources
-            sources = {}
-            for cafe in self.all_cafes:
-                source = cafe.coordinate_source
-                sources[source] = sources.get(source, 0) + 1
-
             self.logger.info(f"   • Coordinate Sources:")
-            for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+            for source, count in self._source_counts.most_common():
                 self.logger.info(f"     - {source}: {count}")
 
         # Pause/Resume info
@@ -1867,14 +2035,8 @@ class UltimateCafeScraper:
         os.makedirs(os.path.join(base_dir, "json"), exist_ok=True)
         os.makedirs(os.path.join(base_dir, "csv"), exist_ok=True)
 
-        # Calculate statistics
-        precision_scores = [cafe.precision_score for cafe in self.all_cafes]
-        avg_precision = sum(precision_scores) / len(precision_scores) if precision_scores else 0.0
-
-        sources = {}
-        for cafe in self.all_cafes:
-            source = cafe.coordinate_source
-            sources[source] = sources.get(source, 0) + 1
+        # Statistics come from the running counters kept by add_cafe_if_unique
+        avg_precision = self._precision_sum / len(self.all_cafes) if self.all_cafes else 0.0
 
         metadata = {
             'total_cafes': len(self.all_cafes),
@@ -1883,8 +2045,8 @@ class UltimateCafeScraper:
             'statistics': self.stats,
             'precision_stats': {
                 'avg_precision': avg_precision,
-                'high_precision_count': sum(1 for score in precision_scores if score >= 0.8),
-                'coordinate_sources': sources
+                'high_precision_count': self._high_precision_unique,
+                'coordinate_sources': dict(self._source_counts)
             },
             'deduplication_stats': {
                 'unique_cafes': self.stats['unique_cafes'],
@@ -1903,11 +2065,10 @@ class UltimateCafeScraper:
 
         # Save JSON
         json_file = os.path.join(base_dir, f"json/{base_name}.json")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'metadata': metadata,
-                'cafes': [asdict(cafe) for cafe in self.all_cafes]
-            }, f, indent=2, ensure_ascii=False)
+        _dump_json(json_file, {
+            'metadata': metadata,
+            'cafes': [asdict(cafe) for cafe in self.all_cafes]
+        })
 
         # Save CSV
         csv_file = os.path.join(base_dir, f"csv/{base_name}.csv")
@@ -1992,7 +2153,8 @@ def main():
             extract_details = not args.no_details  # Default True unless --no-details is specified
             results = scraper.search_and_extract(args.query, args.max_cafes, extract_details)
             scraper.save_data("custom")
-            scraper.driver.quit()
+            scraper.release_driver()
+            scraper.browser_pool.close_all()
 
         else:
             print("🎯 ULTIMATE CAFE SCRAPER")
@@ -1,14 +1,40 @@
 import json
+import mmap
 import os
 import glob
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-import hashlib
+from concurrent.futures import ProcessPoolExecutor
 import logging
 from pathlib import Path
 import sys
 from tqdm import tqdm
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - stats fall back to pure Python
+    np = None
+
+try:
+    import orjson  # 2-5x faster parse, 5-10x faster serialize than stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # streaming parser, keeps one cafe dict alive at a time
+except ImportError:
+    ijson = None
+
+try:
+    import rapidjson  # can parse straight out of an mmap'd buffer
+except ImportError:
+    rapidjson = None
+
+# Files above this size are streamed item-by-item instead of being fully
+# materialized (and pickled back from a worker process) in one piece
+LARGE_FILE_THRESHOLD = 32 * 1024 * 1024
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +46,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _parse_worker(filepath: str) -> Tuple[str, Optional[Dict]]:
+    """Load and parse one JSON file (runs in a worker process)"""
+    try:
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return filepath, orjson.loads(f.read())
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return filepath, json.load(f)
+    except (OSError, ValueError):
+        return filepath, None
+
 class CafeDataMerger:
     def __init__(self, enable_progress_bar: bool = True):
         self.merged_cafes = {}
@@ -31,21 +68,24 @@ class CafeDataMerger:
             'total_duplicates': 0,
             'total_errors': 0
         }
+        # Running aggregates maintained at merge time so the final output
+        # doesn't need a stats pass over every cafe
+        self._rating_sum = 0.0
+        self._rating_count = 0
+        self._reviews_sum = 0
+        self._reviews_count = 0
 
     def get_json_files_from_folder(self, folder_path: str, pattern: str = "*.json") -> List[str]:
         """Get all JSON files from a folder with better error handling"""
         folder_path = Path(folder_path)
 
-        if not folder_path.exists():
-            logger.error(f"Folder not found: {folder_path}")
-            return []
-
+        # One stat answers both questions: is_dir() is False for a missing
+        # path too, so the separate exists() check was a redundant syscall
         if not folder_path.is_dir():
-            logger.error(f"Path is not a directory: {folder_path}")
+            logger.error(f"Folder not found or not a directory: {folder_path}")
             return []
 
         # Use glob to find all JSON files
-        search_pattern = folder_path / pattern
         json_files = list(folder_path.glob(pattern))
 
         if not json_files:
@@ -55,19 +95,31 @@ class CafeDataMerger:
         # Convert to strings and sort for consistent processing
         json_files = sorted([str(f) for f in json_files])
 
-        logger.info(f"Found {len(json_files)} JSON files in {folder_path}:")
-        for file in json_files:
-            logger.info(f"  - {Path(file).name}")
+        logger.info("Found %d JSON files in %s", len(json_files), folder_path)
+        if logger.isEnabledFor(logging.DEBUG):
+            for file in json_files:
+                logger.debug("  - %s", Path(file).name)
 
         return json_files
 
     def load_json_file(self, filepath: str) -> Optional[Dict]:
         """Load and parse JSON file with enhanced error handling"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"Successfully loaded {filepath}")
-                return data
+            # Huge files: parse straight from an mmap so the OS pages bytes
+            # in on demand and can drop them after the parse, instead of
+            # holding a full in-memory copy alongside the parsed objects
+            if rapidjson is not None and os.path.getsize(filepath) > LARGE_FILE_THRESHOLD:
+                with open(filepath, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = rapidjson.loads(mm)
+            elif orjson is not None:
+                with open(filepath, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            logger.debug("Successfully loaded %s", filepath)
+            return data
         except FileNotFoundError:
             logger.error(f"File not found: {filepath}")
             self.stats['total_errors'] += 1
@@ -80,81 +132,52 @@ class CafeDataMerger:
 
         return None
 
-    def generate_cafe_key(self, cafe: Dict) -> str:
+    def generate_cafe_key(self, cafe: Dict) -> Tuple:
         """Generate unique key for cafe based on name and coordinates with fallback"""
-        name = cafe.get('name', '').strip().lower()
-        lat = str(cafe.get('lat', ''))
-        lon = str(cafe.get('lon', ''))
-
-        # Create hash from name + coordinates for unique identification
-        key_string = f"{name}_{lat}_{lon}"
-        return hashlib.md5(key_string.encode()).hexdigest()[:12]
-
-    def is_better_data(self, existing_cafe: Dict, new_cafe: Dict) -> bool:
-        """Determine if new cafe data is better than existing data with enhanced logic"""
-        # Prioritize data completeness
-        existing_score = self.calculate_completeness_score(existing_cafe)
-        new_score = self.calculate_completeness_score(new_cafe)
-
-        if new_score > existing_score:
-            return True
-        elif new_score == existing_score:
-            # If completeness is same, prefer newer data or higher ratings
-            existing_rating = existing_cafe.get('rating', 0)
-            new_rating = new_cafe.get('rating', 0)
-
-            # Also consider review count for tie-breaking
-            if new_rating == existing_rating:
-                existing_reviews = existing_cafe.get('reviews_count', 0)
-                new_reviews = new_cafe.get('reviews_count', 0)
-                return new_reviews > existing_reviews
-
-            return new_rating > existing_rating
-
-        return False
-
-    def calculate_completeness_score(self, cafe: Dict) -> int:
-        """Calculate data completeness score with weighted fields"""
-        score = 0
-        field_weights = {
-            'address': 2,
-            'rating': 1,
-            'reviews_count': 1,
-            'price_range': 1,
-            'phone': 1,
-            'website': 1,
-            'opening_hours': 1,
-            'opening_hours_weekly': 3,  # Weekly hours are more valuable
-            'maps_link': 1,
-            'district': 1,
-            'village': 1,
-            'regency': 1
-        }
-
-        for field, weight in field_weights.items():
-            value = cafe.get(field)
-            if value and value != "" and value != 0 and value != {}:
-                if field == 'opening_hours_weekly' and isinstance(value, dict) and len(value) > 0:
-                    score += weight
-                elif isinstance(value, (str, int, float)) and value:
-                    score += weight
-
-        return score
+        # The key only lives in-process, so a plain tuple is enough: the dict
+        # hashes it natively in C, with no digest or string building at all
+        return (cafe.get('name', '').strip().lower(), cafe.get('lat'), cafe.get('lon'))
+
+    @staticmethod
+    def _parsed_ts(cafe: Dict) -> Optional[datetime]:
+        """Parse scraped_at once and cache the datetime on the entry itself"""
+        dt = cafe.get('_scraped_dt')
+        if dt is None:
+            raw = cafe.get('scraped_at')
+            if not raw:
+                return None
+            try:
+                dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+            except ValueError:
+                return None
+            cafe['_scraped_dt'] = dt
+        return dt
+
+    # Only these fields can actually differ between duplicates of the same
+    # physical cafe - the dedup key already pins name/lat/lon - so the merge
+    # iterates this allowlist instead of every key of the incoming record.
+    # It also makes the metadata-key skip (scraped_at, search_query, ...)
+    # implicit. scraped_at is handled separately below.
+    _MERGE_KEYS = (
+        'rating', 'reviews_count', 'opening_hours_weekly', 'address',
+        'phone', 'website', 'opening_hours', 'price_range', 'maps_link',
+        'type', 'district', 'village', 'regency'
+    )
 
     def merge_cafe_data(self, existing_cafe: Dict, new_cafe: Dict) -> Dict:
         """Merge two cafe entries, keeping the best data from each with enhanced logic"""
         merged = existing_cafe.copy()
+        new_get = new_cafe.get
 
-        # For each field, keep the more complete or newer data
-        for key, value in new_cafe.items():
-            existing_value = merged.get(key)
-
-            # Skip metadata fields
-            if key in ['scraped_at', 'search_query', 'coordinate_source', 'precision_score']:
+        # For each merge-relevant field, keep the more complete or newer data
+        for key in self._MERGE_KEYS:
+            value = new_get(key)
+            if not value:
                 continue
+            existing_value = merged.get(key)
 
             # If existing value is empty/null and new value has content
-            if (not existing_value or existing_value == "" or existing_value == 0 or existing_value == {}) and value:
+            if not existing_value:
                 merged[key] = value
             # For ratings, keep higher rating
             elif key == 'rating' and isinstance(value, (int, float)) and value > existing_value:
@@ -170,19 +193,97 @@ class CafeDataMerger:
                 if len(value) > len(existing_value):
                     merged[key] = value
 
-        # Update scraped_at to latest
-        existing_time = existing_cafe.get('scraped_at')
-        new_time = new_cafe.get('scraped_at')
+        # Update scraped_at to latest; the cached datetime means an entry
+        # that survives many duplicate rounds is only ever parsed once
+        existing_dt = self._parsed_ts(existing_cafe)
+        new_dt = self._parsed_ts(new_cafe)
 
-        if existing_time and new_time:
-            try:
-                existing_dt = datetime.fromisoformat(existing_time.replace('Z', '+00:00'))
-                new_dt = datetime.fromisoformat(new_time.replace('Z', '+00:00'))
-                merged['scraped_at'] = new_time if new_dt > existing_dt else existing_time
-            except ValueError:
-                merged['scraped_at'] = new_time or existing_time
+        if existing_dt and new_dt:
+            if new_dt > existing_dt:
+                merged['scraped_at'] = new_cafe['scraped_at']
+                merged['_scraped_dt'] = new_dt
+        else:
+            merged['scraped_at'] = new_cafe.get('scraped_at') or existing_cafe.get('scraped_at')
+            merged.pop('_scraped_dt', None)
+
+        return merged
+
+    def _merge_fast(self, existing_cafe: Dict, new_cafe: Dict) -> Dict:
+        """Straight-line specialization of merge_cafe_data for the hot path
+
+        Unrolls the _MERGE_KEYS loop into fixed code: no key iteration and
+        no per-key isinstance dispatch, just local loads and compares. Must
+        stay in sync with merge_cafe_data, which remains the readable
+        reference implementation.
+        """
+        merged = existing_cafe.copy()
+        get = merged.get
+        new_get = new_cafe.get
+
+        v = new_get('rating')
+        if isinstance(v, (int, float)) and v > (get('rating') or 0):
+            merged['rating'] = v
+
+        v = new_get('reviews_count')
+        if isinstance(v, int) and v > (get('reviews_count') or 0):
+            merged['reviews_count'] = v
+
+        v = new_get('opening_hours_weekly')
+        if isinstance(v, dict) and v:
+            old = get('opening_hours_weekly')
+            merged['opening_hours_weekly'] = {**old, **v} if isinstance(old, dict) and old else v
+
+        v = new_get('address')
+        if isinstance(v, str) and v:
+            old = get('address')
+            if not isinstance(old, str) or not old or len(v) > len(old):
+                merged['address'] = v
+
+        v = new_get('phone')
+        if v and not get('phone'):
+            merged['phone'] = v
+
+        v = new_get('website')
+        if v and not get('website'):
+            merged['website'] = v
+
+        v = new_get('opening_hours')
+        if v and not get('opening_hours'):
+            merged['opening_hours'] = v
+
+        v = new_get('price_range')
+        if v and not get('price_range'):
+            merged['price_range'] = v
+
+        v = new_get('maps_link')
+        if v and not get('maps_link'):
+            merged['maps_link'] = v
+
+        v = new_get('type')
+        if v and not get('type'):
+            merged['type'] = v
+
+        v = new_get('district')
+        if v and not get('district'):
+            merged['district'] = v
+
+        v = new_get('village')
+        if v and not get('village'):
+            merged['village'] = v
+
+        v = new_get('regency')
+        if v and not get('regency'):
+            merged['regency'] = v
+
+        existing_dt = self._parsed_ts(existing_cafe)
+        new_dt = self._parsed_ts(new_cafe)
+        if existing_dt and new_dt:
+            if new_dt > existing_dt:
+                merged['scraped_at'] = new_cafe['scraped_at']
+                merged['_scraped_dt'] = new_dt
         else:
-            merged['scraped_at'] = new_time or existing_time
+            merged['scraped_at'] = new_get('scraped_at') or get('scraped_at')
+            merged.pop('_scraped_dt', None)
 
         return merged
 
@@ -197,64 +298,164 @@ class CafeDataMerger:
     def process_files(self, file_paths: List[str]) -> Optional[Dict]:
         """Process multiple JSON files and merge cafe data with enhanced progress tracking"""
         self.stats = {'total_processed': 0, 'total_unique': 0, 'total_duplicates': 0, 'total_errors': 0}
+        self._rating_sum = 0.0
+        self._rating_count = 0
+        self._reviews_sum = 0
+        self._reviews_count = 0
 
         logger.info("Starting to process files...")
 
-        # Use tqdm for progress bar if enabled
-        file_iterator = tqdm(file_paths, desc="Processing files") if self.enable_progress_bar else file_paths
+        # Large files are streamed serially to cap peak memory; the rest go
+        # through the parse pool
+        small_files = []
+        large_files = []
+        for filepath in file_paths:
+            try:
+                size = os.path.getsize(filepath)
+            except OSError:
+                size = 0
+            if ijson is not None and size > LARGE_FILE_THRESHOLD:
+                large_files.append(filepath)
+            else:
+                small_files.append(filepath)
+
+        # Parse files across cores; merging stays serial on the main process
+        # because it mutates the shared merged_cafes dict
+        if small_files:
+            with ProcessPoolExecutor() as executor:
+                parsed_files = executor.map(_parse_worker, small_files, chunksize=4)
+
+                # Throttle the progress bar: mininterval batches terminal
+                # redraws instead of repainting on every file, and the low
+                # smoothing keeps the rate estimate steady across the
+                # fast/slow mix of file sizes
+                pbar = None
+                if self.enable_progress_bar:
+                    pbar = tqdm(total=len(small_files), desc="Processing files",
+                                mininterval=0.5, smoothing=0.1)
+
+                for filepath, data in parsed_files:
+                    self._merge_file_data(filepath, data)
+                    if pbar is not None:
+                        pbar.update(1)
+
+                if pbar is not None:
+                    pbar.close()
+
+        for filepath in large_files:
+            self._merge_file_streaming(filepath)
 
-        for filepath in file_iterator:
-            if not os.path.exists(filepath):
-                logger.error(f"File not found: {filepath}")
-                self.stats['total_errors'] += 1
-                continue
+        self._print_summary()
+        return self.create_final_output()
 
-            logger.info(f"Processing: {Path(filepath).name}")
-            data = self.load_json_file(filepath)
+    def _merge_file_data(self, filepath: str, data: Optional[Dict]):
+        """Merge one parsed file's cafes into the shared merged_cafes dict"""
+        if data is None:
+            logger.error(f"Failed to load {filepath}")
+            self.stats['total_errors'] += 1
+            return
 
-            if not data or 'cafes' not in data:
-                logger.warning(f"Invalid data format in {filepath}")
-                self.stats['total_errors'] += 1
-                continue
+        logger.info("Processing: %s", Path(filepath).name)
+
+        if 'cafes' not in data:
+            logger.warning(f"Invalid data format in {filepath}")
+            self.stats['total_errors'] += 1
+            return
 
-            # Store metadata
-            if 'metadata' in data:
-                self.all_files_metadata.append({
-                    'file': filepath,
-                    'metadata': data['metadata']
-                })
+        # Store metadata
+        if 'metadata' in data:
+            self.all_files_metadata.append({
+                'file': filepath,
+                'metadata': data['metadata']
+            })
+
+        # Process cafes
+        cafes = data['cafes']
+        file_processed = len(cafes)
+        file_duplicates = 0
+
+        merge_cafe = self._merge_cafe
+        for cafe in cafes:
+            file_duplicates += merge_cafe(cafe)
+
+        logger.info("  - Processed: %d cafes", file_processed)
+        logger.info("  - Duplicates in this file: %d", file_duplicates)
+
+    def _merge_cafe(self, cafe: Dict) -> int:
+        """Merge a single cafe into merged_cafes; returns 1 if it was a duplicate"""
+        stats = self.stats
+        merged_cafes = self.merged_cafes
+        stats['total_processed'] += 1
+        cafe_key = self.generate_cafe_key(cafe)
+
+        # setdefault probes the table once for lookup and insert combined;
+        # identity with the candidate tells us whether the slot was free
+        existing_cafe = merged_cafes.setdefault(cafe_key, cafe)
+        if existing_cafe is not cafe:
+            # Duplicate found - merge data. merge_cafe_data already keeps the
+            # best value per field, so scoring the two entries first decided
+            # nothing: both arms of the old is_better_data branch made the
+            # same call
+            stats['total_duplicates'] += 1
+            merged = self._merge_fast(existing_cafe, cafe)
+            merged_cafes[cafe_key] = merged
+
+            # Delta-update the running aggregates: subtract what the old
+            # entry contributed, add what the merged one does
+            old_rating = existing_cafe.get('rating') or 0
+            new_rating = merged.get('rating') or 0
+            if new_rating != old_rating:
+                self._rating_sum += new_rating - old_rating
+                if not old_rating:
+                    self._rating_count += 1
+            old_reviews = existing_cafe.get('reviews_count') or 0
+            new_reviews = merged.get('reviews_count') or 0
+            if new_reviews != old_reviews:
+                self._reviews_sum += new_reviews - old_reviews
+                if not old_reviews:
+                    self._reviews_count += 1
+            return 1
+
+        # New unique cafe (already inserted by setdefault)
+        stats['total_unique'] += 1
+        rating = cafe.get('rating') or 0
+        if rating:
+            self._rating_sum += rating
+            self._rating_count += 1
+        reviews = cafe.get('reviews_count') or 0
+        if reviews:
+            self._reviews_sum += reviews
+            self._reviews_count += 1
+        return 0
+
+    def _merge_file_streaming(self, filepath: str):
+        """Stream-merge a large file so only one cafe dict is alive at a time"""
+        logger.info("Processing (streaming): %s", Path(filepath).name)
 
-            # Process cafes
-            cafes = data['cafes']
-            file_processed = len(cafes)
+        try:
+            # Metadata first (it is small), then the cafes array item-by-item
+            with open(filepath, 'rb') as f:
+                for metadata in ijson.items(f, 'metadata'):
+                    self.all_files_metadata.append({
+                        'file': filepath,
+                        'metadata': metadata
+                    })
+                    break
+
+            file_processed = 0
             file_duplicates = 0
+            merge_cafe = self._merge_cafe
+            with open(filepath, 'rb') as f:
+                for cafe in ijson.items(f, 'cafes.item', use_float=True):
+                    file_processed += 1
+                    file_duplicates += merge_cafe(cafe)
 
-            for cafe in cafes:
-                self.stats['total_processed'] += 1
-                cafe_key = self.generate_cafe_key(cafe)
-
-                if cafe_key in self.merged_cafes:
-                    # Duplicate found - merge data
-                    file_duplicates += 1
-                    self.stats['total_duplicates'] += 1
-                    existing_cafe = self.merged_cafes[cafe_key]
-
-                    if self.is_better_data(existing_cafe, cafe):
-                        # Replace with better data but merge useful fields
-                        self.merged_cafes[cafe_key] = self.merge_cafe_data(existing_cafe, cafe)
-                    else:
-                        # Keep existing but merge useful fields from new data
-                        self.merged_cafes[cafe_key] = self.merge_cafe_data(existing_cafe, cafe)
-                else:
-                    # New unique cafe
-                    self.merged_cafes[cafe_key] = cafe
-                    self.stats['total_unique'] += 1
-
-            logger.info(f"  - Processed: {file_processed} cafes")
-            logger.info(f"  - Duplicates in this file: {file_duplicates}")
+            logger.info("  - Processed: %d cafes", file_processed)
+            logger.info("  - Duplicates in this file: %d", file_duplicates)
 
-        self._print_summary()
-        return self.create_final_output()
+        except (OSError, ValueError, ijson.JSONError) as e:
+            logger.error("Failed to stream %s: %s", filepath, e)
+            self.stats['total_errors'] += 1
 
     def _print_summary(self):
         """Print processing summary with enhanced formatting"""
@@ -272,12 +473,31 @@ class CafeDataMerger:
         """Create final merged output with enhanced metadata"""
         final_cafes = list(self.merged_cafes.values())
 
-        # Sort by rating (descending) then by review count (descending)
-        final_cafes.sort(key=lambda x: (x.get('rating', 0), x.get('reviews_count', 0)), reverse=True)
+        # Drop the internal timestamp cache before serialization
+        for cafe in final_cafes:
+            cafe.pop('_scraped_dt', None)
+
+        # Sort by rating (descending) then by review count (descending);
+        # lexsort ranks everything in C and we reorder the list once,
+        # instead of building a Python tuple key per cafe
+        if np is not None:
+            sort_arr = np.fromiter(
+                ((cafe.get('rating') or 0, cafe.get('reviews_count') or 0) for cafe in final_cafes),
+                dtype=[('rating', 'f4'), ('reviews', 'i4')], count=len(final_cafes)
+            )
+            order = np.lexsort((-sort_arr['reviews'], -sort_arr['rating']))
+            final_cafes = [final_cafes[i] for i in order]
+        else:
+            final_cafes.sort(key=lambda x: (x.get('rating', 0), x.get('reviews_count', 0)), reverse=True)
+
+        # Statistics come straight from the running aggregates maintained
+        # during merging - no output-time pass over the cafes
+        avg_rating = self._rating_sum / self._rating_count if self._rating_count else 0
+        total_reviews = self._reviews_sum
+        cafes_with_ratings = self._rating_count
+        cafes_with_reviews = self._reviews_count
 
-        # Calculate enhanced statistics
-        ratings = [cafe.get('rating', 0) for cafe in final_cafes if cafe.get('rating', 0) > 0]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
+        type_dist, location_dist, price_dist = self.get_distributions(final_cafes)
 
         # Create comprehensive metadata
         merged_metadata = {
@@ -289,13 +509,13 @@ class CafeDataMerger:
                 "total_unique_cafes": len(final_cafes),
                 "source_files_count": len(self.all_files_metadata),
                 "avg_rating": round(avg_rating, 2),
-                "total_reviews": sum(cafe.get('reviews_count', 0) for cafe in final_cafes),
-                "cafes_with_ratings": len(ratings),
-                "cafes_with_reviews": len([c for c in final_cafes if c.get('reviews_count', 0) > 0])
+                "total_reviews": total_reviews,
+                "cafes_with_ratings": cafes_with_ratings,
+                "cafes_with_reviews": cafes_with_reviews
             },
-            "cafe_types_distribution": self.get_type_distribution(final_cafes),
-            "location_distribution": self.get_location_distribution(final_cafes),
-            "price_range_distribution": self.get_price_distribution(final_cafes),
+            "cafe_types_distribution": type_dist,
+            "location_distribution": location_dist,
+            "price_range_distribution": price_dist,
             "original_files_metadata": self.all_files_metadata
         }
 
@@ -304,39 +524,34 @@ class CafeDataMerger:
             "cafes": final_cafes
         }
 
-    def get_type_distribution(self, cafes: List[Dict]) -> Dict:
-        """Get distribution of cafe types"""
-        type_count = {}
-        for cafe in cafes:
-            cafe_type = cafe.get('type', 'Unknown')
-            type_count[cafe_type] = type_count.get(cafe_type, 0) + 1
-        return type_count
-
-    def get_location_distribution(self, cafes: List[Dict]) -> Dict:
-        """Get distribution of cafe locations"""
-        location_count = {}
+    def get_distributions(self, cafes: List[Dict]) -> Tuple[Dict, Dict, Dict]:
+        """Get type, location and price distributions in a single pass"""
+        type_count: Counter = Counter()
+        location_count: Counter = Counter()
+        price_count: Counter = Counter()
         for cafe in cafes:
-            district = cafe.get('district', 'Unknown')
-            location_count[district] = location_count.get(district, 0) + 1
-        return location_count
-
-    def get_price_distribution(self, cafes: List[Dict]) -> Dict:
-        """Get distribution of cafe price ranges"""
-        price_count = {}
-        for cafe in cafes:
-            price_range = cafe.get('price_range', 'Unknown')
-            price_count[price_range] = price_count.get(price_range, 0) + 1
-        return price_count
+            type_count[cafe.get('type', 'Unknown')] += 1
+            location_count[cafe.get('district', 'Unknown')] += 1
+            price_count[cafe.get('price_range', 'Unknown')] += 1
+        return dict(type_count), dict(location_count), dict(price_count)
 
     def save_merged_data(self, output_path: str, merged_data: Dict) -> bool:
         """Save merged data to JSON file with error handling"""
         try:
             # Ensure output directory exists
-            output_dir = Path(output_path).parent
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(merged_data, f, indent=2, ensure_ascii=False)
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            if orjson is not None:
+                # orjson emits UTF-8 directly (ensure_ascii=False behavior)
+                # and write_bytes hands the whole buffer to the OS in one
+                # syscall instead of dribbling through json.dump's chunks
+                output_path.write_bytes(orjson.dumps(merged_data, option=orjson.OPT_INDENT_2))
+            else:
+                output_path.write_text(
+                    json.dumps(merged_data, indent=2, ensure_ascii=False),
+                    encoding='utf-8'
+                )
 
             logger.info(f"Merged data saved to: {output_path}")
             return True
@@ -351,17 +566,17 @@ class CafeDataMerger:
         logger.info(f"{'='*60}")
 
         for i, cafe in enumerate(self.merged_cafes.values(), 1):
-            logger.info(f"\n{i}. {cafe.get('name', 'Unknown')}")
-            logger.info(f"   Rating: {cafe.get('rating', 'N/A')} ({cafe.get('reviews_count', 0)} reviews)")
-            logger.info(f"   Address: {cafe.get('address', 'No address')}")
-            logger.info(f"   Price Range: {cafe.get('price_range', 'No price info')}")
-            logger.info(f"   Type: {cafe.get('type', 'Unknown')}")
-            logger.info(f"   District: {cafe.get('district', 'Unknown')}")
-            logger.info(f"   Hours: {cafe.get('opening_hours', 'No hours')}")
+            logger.info("\n%d. %s", i, cafe.get('name', 'Unknown'))
+            logger.info("   Rating: %s (%s reviews)", cafe.get('rating', 'N/A'), cafe.get('reviews_count', 0))
+            logger.info("   Address: %s", cafe.get('address', 'No address'))
+            logger.info("   Price Range: %s", cafe.get('price_range', 'No price info'))
+            logger.info("   Type: %s", cafe.get('type', 'Unknown'))
+            logger.info("   District: %s", cafe.get('district', 'Unknown'))
+            logger.info("   Hours: %s", cafe.get('opening_hours', 'No hours'))
             if cafe.get('phone'):
-                logger.info(f"   Phone: {cafe.get('phone')}")
+                logger.info("   Phone: %s", cafe.get('phone'))
             if cafe.get('website'):
-                logger.info(f"   Website: {cafe.get('website')}")
+                logger.info("   Website: %s", cafe.get('website'))
 
 def merge_cafe_folder(folder_path: str, pattern: str = "*.json", output_file: str = None,
                      enable_progress_bar: bool = True) -> Optional[Dict]:
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Scraper Progress Monitor
+Live progress, data quality and ETA reporting for cafe_scraper.py
+
+Run in a second terminal while the scraper is working:
+    python3 tools/scraper_monitor.py
+"""
+
+import contextlib
+import heapq
+import io
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Fastest available JSON decoder: orjson and ujson are C implementations
+# several times quicker than stdlib json on the multi-MB resume file, and
+# all three return identical plain dicts/lists
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        _loads = json.loads
+
+try:
+    import pandas as pd  # vectorized quality analysis when installed
+except ImportError:
+    pd = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import ijson  # stream just the metadata object out of the resume file
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow.parquet as pq  # columnar cache for the analysis views
+except ImportError:
+    pq = None
+
+# Fields the quality views score for completeness, in display order
+_QUALITY_FIELDS = ('name', 'address', 'rating', 'lat', 'lon', 'regency', 'type')
+
+
+class ScraperMonitor:
+    """📊 Read-only monitor over the scraper's state and resume files"""
+
+    def __init__(self, data_dir: str = "data", log_file: str = "logs/cafe_scraper.log"):
+        self.data_dir = data_dir
+        self.state_file = os.path.join(data_dir, "scraper_state.json")
+        self.data_file = os.path.join(data_dir, "resume_data.json")
+        self.log_file = log_file
+
+        # Parsed-JSON cache keyed by (mtime_ns, size): every menu action used
+        # to re-open and re-parse the multi-MB resume file, and a full report
+        # triggers four loads. The key changes whenever the scraper flushes a
+        # new write, so watch mode still picks up fresh data
+        self._cache: Dict[str, tuple] = {}
+
+    @staticmethod
+    def _stat(path: str) -> Optional[os.stat_result]:
+        """One syscall for existence + size + mtime; None if unreadable"""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _load_json(self, path: str) -> Optional[Dict]:
+        """Load a JSON file, reusing the parsed dict while it is unchanged"""
+        st = self._stat(path)
+        if st is None:
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(path, 'rb') as f:
+                data = _loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Failed to read {path}: {e}")
+            return None
+
+        self._cache[path] = (key, data)
+        return data
+
+    def load_progress(self) -> Optional[Dict]:
+        """Load scraper state (strategy index, stats, dedup set sizes)"""
+        return self._load_json(self.state_file)
+
+    def load_data(self) -> Optional[Dict]:
+        """Load the resume data file (metadata + full cafe list)"""
+        return self._load_json(self.data_file)
+
+    def load_metadata(self) -> Optional[Dict]:
+        """Load only the resume file's metadata object.
+
+        The summary views just need the saved_at/total_cafes header, so with
+        ijson installed we stop parsing as soon as the metadata object is out
+        instead of decoding the full cafe list. Falls back to the cached full
+        load otherwise.
+        """
+        if ijson is not None:
+            try:
+                with open(self.data_file, 'rb') as f:
+                    for metadata in ijson.items(f, 'metadata'):
+                        return metadata
+            except (OSError, ValueError, ijson.JSONError):
+                return None
+            return None
+
+        data = self.load_data()
+        return data.get('metadata') if data else None
+
+    def _ensure_parquet(self) -> Optional[str]:
+        """Keep a parquet mirror of the resume cafes next to the JSON file.
+
+        Rebuilt only when the JSON file is newer than the cache, so repeated
+        analysis runs read the compact columnar file instead of re-decoding
+        the full JSON document.
+        """
+        if pd is None or pq is None:
+            return None
+        parquet_file = os.path.join(self.data_dir, "resume_cafes.parquet")
+        src_st = self._stat(self.data_file)
+        if src_st is None:
+            return None
+        cache_st = self._stat(parquet_file)
+        if cache_st is not None and cache_st.st_mtime_ns >= src_st.st_mtime_ns:
+            return parquet_file
+
+        data = self.load_data()
+        cafes = data.get('cafes', []) if data else []
+        if not cafes:
+            return None
+        try:
+            pd.DataFrame(cafes).to_parquet(parquet_file, index=False)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not write parquet cache: {e}")
+            return None
+        return parquet_file
+
+    def load_cafes_df(self, columns: Optional[List[str]] = None) -> Optional["pd.DataFrame"]:
+        """Cafes as a DataFrame, reading only the requested columns when the
+        parquet cache is available; falls back to the cached JSON load."""
+        if pd is None:
+            return None
+
+        parquet_file = self._ensure_parquet()
+        if parquet_file:
+            try:
+                if columns:
+                    available = pq.read_schema(parquet_file).names
+                    columns = [c for c in columns if c in available]
+                return pd.read_parquet(parquet_file, columns=columns or None)
+            except (OSError, ValueError):
+                pass
+
+        data = self.load_data()
+        cafes = data.get('cafes', []) if data else []
+        if not cafes:
+            return None
+        df = pd.DataFrame(cafes)
+        if columns:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def print_progress_summary(self):
+        """Print current scraping progress"""
+        out = [f"\n{'='*50}", "📊 SCRAPER PROGRESS", '='*50]
+        add = out.append
+
+        state = self.load_progress()
+        if not state:
+            add("❌ No scraper state found - is the scraper running?")
+            sys.stdout.write("\n".join(out) + "\n")
+            return
+
+        stats = state.get('stats', {})
+        add(f"🕐 Last state save: {state.get('timestamp', 'unknown')}")
+        add(f"📋 Strategy index: {state.get('current_strategy_index', 0)}")
+        add(f"✅ Unique cafes: {stats.get('unique_cafes', 0)}")
+        add(f"🔄 Duplicates removed: {stats.get('duplicates_removed', 0)}")
+        add(f"📈 Total processed: {stats.get('total_processed', 0)}")
+        add(f"❌ Failed extractions: {stats.get('failed_extractions', 0)}")
+
+        metadata = self.load_metadata()
+        if metadata:
+            add(f"💾 Resume file: {metadata.get('total_cafes', 0)} cafes "
+                f"(saved {metadata.get('saved_at', 'unknown')})")
+        st = self._stat(self.data_file)
+        if st is not None:
+            add(f"💾 Data file size: {st.st_size / 1048576:.1f} MB")
+        st = self._stat(self.log_file)
+        if st is not None:
+            add(f"📜 Log file size: {st.st_size / 1048576:.1f} MB")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+    def analyze_data_quality(self):
+        """Analyze completeness and distribution of the scraped data"""
+        out = [f"\n{'='*50}", "🔍 DATA QUALITY", '='*50]
+
+        fields = list(_QUALITY_FIELDS)
+        if pd is not None:
+            df = self.load_cafes_df(columns=fields)
+            if df is None or df.empty:
+                out.append("❌ No cafe data to analyze")
+            else:
+                self._analyze_quality_df(df, fields, out)
+            sys.stdout.write("\n".join(out) + "\n")
+            return
+
+        data = self.load_data()
+        cafes = data.get('cafes', []) if data else []
+        if not cafes:
+            out.append("❌ No cafe data to analyze")
+        else:
+            self._analyze_quality_py(cafes, out)
+        sys.stdout.write("\n".join(out) + "\n")
+
+    def _analyze_quality_df(self, df: "pd.DataFrame", fields: List[str], out: List[str]):
+        """Vectorized analysis: column-pruned DataFrame, C loops throughout"""
+        add = out.append
+        add(f"📋 Total cafes: {len(df)}")
+        add("\n📊 Field completeness:")
+        for field in fields:
+            if field not in df:
+                add(f"   {field:<12}   0.0%")
+                continue
+            col = df[field]
+            filled = (col.notna() & (col != 0)
+                      & (col.astype(str).str.strip() != '')).mean() * 100
+            add(f"   {field:<12} {filled:5.1f}%")
+
+        if 'regency' in df:
+            regency_counts = df['regency'].fillna('Unknown').replace('', 'Unknown').value_counts()
+            add("\n🗺️  By regency:")
+            for regency, count in regency_counts.items():
+                add(f"   {regency:<20} {count}")
+
+        if 'type' in df:
+            type_counts = df['type'].fillna('Unknown').replace('', 'Unknown').value_counts()
+            add("\n🏷️  By type:")
+            for cafe_type, count in type_counts.head(10).items():
+                add(f"   {cafe_type:<20} {count}")
+
+        if 'rating' in df:
+            ratings = pd.to_numeric(df['rating'], errors='coerce').fillna(0)
+            rated = ratings[ratings > 0]
+            if len(rated):
+                add(f"\n⭐ Rated cafes: {len(rated)} (avg {rated.mean():.2f})")
+
+    def _analyze_quality_py(self, cafes: List[Dict], out: List[str]):
+        """Pure-Python fallback when pandas is not installed.
+
+        Everything is accumulated in a single pass over the cafe list
+        instead of one walk per field plus three more for the summaries.
+        Hot-loop lookups (dict.get, the field tuple, list indexing) are
+        bound to locals since this runs len(cafes) * len(fields) times.
+        """
+        fields = _QUALITY_FIELDS
+        n = len(cafes)
+        filled = [0] * len(fields)
+        regency_counts = Counter()
+        type_counts = Counter()
+        rating_sum = 0.0
+        rated = 0
+        get = dict.get
+
+        for cafe in cafes:
+            for i, field in enumerate(fields):
+                value = get(cafe, field)
+                if value and str(value).strip():
+                    filled[i] += 1
+
+            regency_counts[get(cafe, 'regency') or 'Unknown'] += 1
+            type_counts[get(cafe, 'type') or 'Unknown'] += 1
+
+            rating = get(cafe, 'rating', 0)
+            if rating > 0:
+                rating_sum += rating
+                rated += 1
+
+        add = out.append
+        add(f"📋 Total cafes: {n}")
+        add("\n📊 Field completeness:")
+        for i, field in enumerate(fields):
+            add(f"   {field:<12} {filled[i] / n * 100:5.1f}%")
+
+        add("\n🗺️  By regency:")
+        for regency, count in regency_counts.most_common():
+            add(f"   {regency:<20} {count}")
+
+        add("\n🏷️  By type:")
+        for cafe_type, count in type_counts.most_common(10):
+            add(f"   {cafe_type:<20} {count}")
+
+        if rated:
+            add(f"\n⭐ Rated cafes: {rated} (avg {rating_sum / rated:.2f})")
+
+    def estimate_completion_time(self, target: int = 1000):
+        """Estimate time remaining to reach the target cafe count"""
+        out = [f"\n{'='*50}", "⏳ COMPLETION ESTIMATE", '='*50]
+        add = out.append
+
+        state = self.load_progress()
+        stats = state.get('stats', {}) if state else {}
+        unique = stats.get('unique_cafes', 0)
+        start_time = stats.get('start_time')
+
+        if not state:
+            add("❌ No scraper state found")
+        elif not start_time or not unique:
+            add("❌ Not enough data for an estimate yet")
+        else:
+            elapsed = time.time() - start_time
+            rate = unique / elapsed if elapsed > 0 else 0
+            remaining = max(target - unique, 0)
+
+            add(f"🎯 Target: {target} cafes")
+            add(f"✅ Collected: {unique} ({unique / target * 100:.1f}%)")
+            add(f"⚡ Rate: {rate * 3600:.1f} cafes/hour")
+            if rate > 0 and remaining:
+                eta_seconds = remaining / rate
+                add(f"⏰ Estimated time remaining: {eta_seconds / 3600:.1f} hours")
+            elif not remaining:
+                add("🎉 Target reached!")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+    def show_top_cafes(self, n: int = 10):
+        """Show the top-rated cafes collected so far"""
+        out = [f"\n{'='*50}", f"🏆 TOP {n} CAFES", '='*50]
+        add = out.append
+
+        if pd is not None:
+            df = self.load_cafes_df(columns=['name', 'rating', 'reviews_count'])
+            if df is not None and 'rating' in df:
+                if np is not None:
+                    # Partial selection: argpartition pulls out the n best
+                    # rows in O(m) before only those get fully sorted
+                    r = df['rating'].to_numpy('float32', na_value=0.0)
+                    idx = np.flatnonzero(r > 0)
+                    if len(idx) > n:
+                        idx = idx[np.argpartition(r[idx], -n)[-n:]]
+                    top = df.iloc[idx].sort_values('rating', ascending=False)
+                else:
+                    top = df[df['rating'] > 0].nlargest(n, 'rating')
+                for i, row in enumerate(top.itertuples(index=False), 1):
+                    add(f"{i:2}. {getattr(row, 'name', 'Unknown'):<40} "
+                        f"⭐ {row.rating:.1f} ({getattr(row, 'reviews_count', 0)} reviews)")
+                sys.stdout.write("\n".join(out) + "\n")
+                return
+
+        data = self.load_data()
+        cafes = data.get('cafes', []) if data else []
+        if not cafes:
+            add("❌ No cafe data yet")
+        else:
+            top_cafes = heapq.nlargest(
+                n, (c for c in cafes if c.get('rating', 0) > 0),
+                key=lambda c: c.get('rating', 0))
+            for i, cafe in enumerate(top_cafes, 1):
+                add(f"{i:2}. {cafe.get('name', 'Unknown'):<40} "
+                    f"⭐ {cafe.get('rating', 0):.1f} ({cafe.get('reviews_count', 0)} reviews)")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+    _vt_enabled = os.name != 'nt'
+
+    def _clear_screen(self):
+        """Clear the terminal with an ANSI escape instead of forking a shell"""
+        if not sys.stdout.isatty():
+            return
+        if not ScraperMonitor._vt_enabled:
+            os.system('')  # one-time: switches the Windows console into VT mode
+            ScraperMonitor._vt_enabled = True
+        print('\x1b[2J\x1b[H', end='', flush=True)
+
+    def watch_progress(self, interval: int = 30):
+        """Continuously refresh the progress summary"""
+        print(f"👀 Watching progress (refresh every {interval}s, Ctrl+C to stop)")
+        last_mtime = -1
+        try:
+            while True:
+                st = self._stat(self.state_file)
+                mtime = st.st_mtime_ns if st is not None else None
+                if mtime == last_mtime:
+                    # Scraper has not flushed new state; a timestamp line is
+                    # enough and keeps the previous summary on screen
+                    print(f"⏸️  No update as of {datetime.now().strftime('%H:%M:%S')}",
+                          flush=True)
+                else:
+                    last_mtime = mtime
+                    self._clear_screen()
+                    self.print_progress_summary()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+
+    def generate_report(self):
+        """Print the full report and save an identical copy next to the data.
+
+        The four sections are rendered once into a StringIO and the buffer
+        is then echoed to the terminal and written to disk in one call, so
+        the file is a verbatim copy instead of a hand-maintained subset.
+        """
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            self.print_progress_summary()
+            self.analyze_data_quality()
+            self.estimate_completion_time()
+            self.show_top_cafes()
+        report = buf.getvalue()
+        sys.stdout.write(report)
+
+        report_file = os.path.join(
+            self.data_dir, f"monitor_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+        try:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                f.write(f"Scraper monitor report - {datetime.now().isoformat()}\n")
+                f.write(report)
+            print(f"\n💾 Report saved to: {report_file}")
+        except OSError as e:
+            print(f"❌ Failed to save report: {e}")
+
+
+def main():
+    """Interactive monitor menu"""
+    monitor = ScraperMonitor()
+
+    print("=== 📊 CAFE SCRAPER MONITOR ===")
+    print("1. Progress summary")
+    print("2. Data quality analysis")
+    print("3. Completion estimate")
+    print("4. Top cafes")
+    print("5. Watch progress (live)")
+    print("6. Full report")
+
+    try:
+        choice = input("Enter choice (1-6): ").strip()
+
+        if choice == "1":
+            monitor.print_progress_summary()
+        elif choice == "2":
+            monitor.analyze_data_quality()
+        elif choice == "3":
+            monitor.estimate_completion_time()
+        elif choice == "4":
+            monitor.show_top_cafes()
+        elif choice == "5":
+            monitor.watch_progress()
+        elif choice == "6":
+            monitor.generate_report()
+        else:
+            print("Invalid choice")
+    except KeyboardInterrupt:
+        print("\n👋 Bye")
+
+
+if __name__ == "__main__":
+    main()